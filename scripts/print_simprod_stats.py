@@ -15,51 +15,91 @@
 
 # ruff: noqa: F821, T201
 
-import csv
-import json
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 
-from utils import patterns
+from utils import utils
 
 
 def printline(*line):
     print("{:<50} {:>20} {:>6} {:>14} {:>10}".format(*line))
 
 
+def scan_simid_dirs(bdir):
+    """Yield ``(tier, simid, path)`` for each simid directory in `bdir`."""
+    # no benchmark has been written yet
+    try:
+        tiers = os.scandir(bdir)
+    except FileNotFoundError:
+        return
+
+    with tiers:
+        for tier in tiers:
+            if not tier.is_dir():
+                continue
+            with os.scandir(tier.path) as simids:
+                for simd in simids:
+                    if simd.is_dir():
+                        yield tier.name, simd.name, simd.path
+
+
+def scan_tsv_files(simd_path):
+    """List the benchmark files in a simid directory."""
+    with os.scandir(simd_path) as entries:
+        return [e.path for e in entries if e.name.endswith(".tsv")]
+
+
+def read_wall_time(tsv):
+    """Read the wall time (column ``s``) from a Snakemake benchmark file."""
+    with Path(tsv).open() as f:
+        header = f.readline().rstrip("\n").split("\t")
+        return float(f.readline().rstrip("\n").split("\t")[header.index("s")])
+
+
 printline("     ", "wall time [s]", "    ", "wall time [s]", "         ")
 printline("simid", " (cumulative)", "jobs", "    (per job)", "primaries")
 printline("-----", "-------------", "----", "-------------", "---------")
 
-bdir = Path(snakemake.config["paths"]["benchmarks"])
+bdir = snakemake.config["paths"]["benchmarks"]
+
+simds = sorted(scan_simid_dirs(bdir))
+tsvs = [
+    ((tier, simid), jobd)
+    for tier, simid, path in simds
+    for jobd in scan_tsv_files(path)
+]
+
+# benchmark files are tiny, reading them is dominated by I/O latency
+with ThreadPoolExecutor(max_workers=32) as pool:
+    wall_times = pool.map(read_wall_time, [jobd for _, jobd in tsvs])
+
+    njobs = defaultdict(int)
+    data = defaultdict(float)
+    for (simd, _), wall_time in zip(tsvs, wall_times):
+        njobs[simd] += 1
+        data[simd] += wall_time
 
 tot_wall_time = 0
-for simd in sorted(bdir.glob("*/*")):
-    njobs = 0
-    data = {"wall_time": 0}
-    for jobd in simd.glob("*.tsv"):
-        njobs += 1
-        with jobd.open(newline="") as f:
-            this_data = next(iter(csv.DictReader(f, delimiter="\t")))
-            data["wall_time"] += float(this_data["s"])
-    tot_wall_time += data["wall_time"]
-
-    if njobs == 0:
-        continue
+for tier_name, simid, _ in simds:
+    simd = (tier_name, simid)
+    tot_wall_time += data[simd]
 
-    tier = simd.parent.name if simd.parent.name in ("ver", "raw") else "raw"
+    if njobs[simd] == 0:
+        continue
 
-    tdir = patterns.template_macro_dir(snakemake.config, tier=tier)
-    with (tdir / "simconfig.json").open() as f:
-        config = json.load(f)[simd.name]
+    tier = tier_name if tier_name in ("ver", "raw") else "raw"
 
+    config = utils.get_simconfig(snakemake.config, tier, simid)
     nprim = config["number_of_primaries"]
 
     printline(
-        simd.parent.name + "." + simd.name,
-        str(timedelta(seconds=int(data["wall_time"]))),
-        njobs,
-        str(timedelta(seconds=int(data["wall_time"] / njobs))),
+        tier_name + "." + simid,
+        str(timedelta(seconds=int(data[simd]))),
+        njobs[simd],
+        str(timedelta(seconds=int(data[simd] / njobs[simd]))),
         f"{nprim:.2E}",
     )
 
@@ -15,9 +15,6 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
 from . import patterns, utils
 
 
@@ -30,10 +27,7 @@ def get_simid_n_macros(config, tier, simid):
     if "benchmark" in config and config["benchmark"].get("enabled", False):
         return 1
 
-    tdir = patterns.template_macro_dir(config, tier=tier)
-
-    with (Path(tdir) / "simconfig.json").open() as f:
-        sconfig = json.load(f)[simid]
+    sconfig = utils.get_simconfig(config, tier, simid)
 
     if "vertices" in sconfig and "number_of_jobs" not in sconfig:
         return len(gen_list_of_simid_outputs(config, "ver", sconfig["vertices"]))
@@ -74,11 +68,8 @@ def gen_list_of_plots_outputs(config, tier, simid):
 def collect_simconfigs(config, tiers):
     cfgs = []
     for tier in tiers:
-        with (
-            patterns.template_macro_dir(config, tier=tier) / "simconfig.json"
-        ).open() as f:
-            for sid, _val in json.load(f).items():
-                cfgs.append((tier, sid, get_simid_n_macros(config, tier, sid)))
+        for sid in utils.get_simconfig(config, tier):
+            cfgs.append((tier, sid, get_simid_n_macros(config, tier, sid)))
 
     return cfgs
 
@@ -86,10 +77,7 @@ def collect_simconfigs(config, tiers):
 def gen_list_of_all_simids(config, tier):
     if tier not in ("ver", "raw"):
         tier = "raw"
-    with (
-        patterns.template_macro_dir(config, tier=tier) / "simconfig.json"
-    ).open() as f:
-        return json.load(f).keys()
+    return utils.get_simconfig(config, tier).keys()
 
 
 def gen_list_of_all_macros(config, tier):
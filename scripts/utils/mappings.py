@@ -16,14 +16,22 @@
 # ruff: noqa: F821, T201
 from __future__ import annotations
 
-from legendmeta import LegendMetadata
+import functools
 
 # TODO: add support for SiPMs
 
 
+@functools.lru_cache(maxsize=None)
+def _legend_metadata():
+    """Returns a (cached) LEGEND metadata instance, shared by all mappings."""
+    from legendmeta import LegendMetadata
+
+    return LegendMetadata()
+
+
 def l200a_mageid_to_detname(mageid: int, on: str | datetime | None = None):
     """Convert MaGe identifier to LEGEND HPGe detector name."""
-    lmeta = LegendMetadata()
+    lmeta = _legend_metadata()
     chmap = lmeta.channelmap(on=on)
 
     mageid = int(mageid)
@@ -40,7 +48,7 @@ def l200a_mageid_to_detname(mageid: int, on: str | datetime | None = None):
 
 def l200a_detname_to_mageid(detname: str, on: str | datetime | None = None):
     """Convert LEGEND HPGe detector name to MaGe identifier."""
-    lmeta = LegendMetadata()
+    lmeta = _legend_metadata()
     chmap = lmeta.channelmap(on=on)
 
     return int(
@@ -16,8 +16,8 @@
 """Prepare pattern strings to be used in Snakemake rules.
 
 Extra keyword arguments are typically interpreted as variables to be
-substituted in the returned (structure of) strings. They are passed to
-:func:`snakemake.io.expand`.
+substituted in the returned (structure of) strings, with the same semantics
+as :func:`snakemake.io.expand` with ``allow_missing=True``.
 
 Definitions:
 - ``simid``: string identifier for the simulation run
@@ -27,15 +27,37 @@ Definitions:
 """
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import Iterable
 from pathlib import Path
 
 from snakemake.io import expand
 
+from . import utils
+
+
+class _KeepMissing(dict):
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def _expand(pattern, **kwargs):
+    """Substitutes `kwargs` in `pattern`, leaving unknown fields untouched.
+
+    Same as ``expand(pattern, **kwargs, allow_missing=True)[0]``, but scalar
+    values are substituted with :meth:`str.format_map` instead of going
+    through :func:`snakemake.io.expand`. As in :func:`snakemake.io.expand`,
+    any non-string iterable value is treated as a list of values.
+    """
+    if any(isinstance(v, Iterable) and not isinstance(v, str) for v in kwargs.values()):
+        return expand(pattern, **kwargs, allow_missing=True)[0]
+
+    return pattern.format_map(_KeepMissing(kwargs))
+
 
 def simjob_rel_basename(**kwargs):
     """Formats a partial output path for a `simid` and `jobid`."""
-    return expand("{simid}/{simid}_{jobid}", **kwargs, allow_missing=True)[0]
+    return _expand("{simid}/{simid}_{jobid}", **kwargs)
 
 
 def run_command(config, tier):
@@ -50,7 +72,7 @@ def log_file_path(config, **kwargs):
         / "{tier}"
         / (simjob_rel_basename() + "-tier_{tier}.log")
     )
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 def benchmark_file_path(config, **kwargs):
@@ -60,18 +82,18 @@ def benchmark_file_path(config, **kwargs):
         / "{tier}"
         / (simjob_rel_basename() + "-tier_{tier}.tsv")
     )
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 def plots_file_path(config, **kwargs):
     """Formats a benchmark file path for a `simid` and `jobid`."""
     pat = str(Path(config["paths"]["plots"]) / "{tier}" / "{simid}")
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 def genmacro_log_file_path(config, **kwargs):
     """Formats a log file path for a `simid` and `jobid`."""
-    return expand(
+    return _expand(
         str(
             Path(config["paths"]["log"])
             / "macros"
@@ -79,14 +101,13 @@ def genmacro_log_file_path(config, **kwargs):
             / (simjob_rel_basename() + "-tier_{tier}.log")
         ),
         **kwargs,
-        allow_missing=True,
-    )[0]
+    )
 
 
 def template_macro_dir(config, **kwargs):
     """Returns the directory path to the macro templates for the current `tier`."""
-    tier = expand("{tier}", **kwargs, allow_missing=True)[0]
-    return Path(config["paths"]["config"]) / "tier" / tier / config["experiment"]
+    tier = _expand("{tier}", **kwargs)
+    return utils.tier_config_dir(config["paths"]["config"], config["experiment"], tier)
 
 
 # ver, raw, hit tiers
@@ -95,9 +116,7 @@ def template_macro_dir(config, **kwargs):
 def macro_gen_inputs(config, tier, simid, **kwargs):
     """Return inputs for the Snakemake rules that generate macros."""
     tdir = template_macro_dir(config, tier=tier)
-
-    with (tdir / "simconfig.json").open() as f:
-        sconfig = json.load(f)[simid]
+    sconfig = utils.get_simconfig(config, tier, simid)
 
     if "template" not in sconfig:
         msg = "simconfig.json blocks must define a 'template' field."
@@ -108,7 +127,7 @@ def macro_gen_inputs(config, tier, simid, **kwargs):
         "cfgfile": str(tdir / "simconfig.json"),
     }
     for k, v in expr.items():
-        expr[k] = expand(v, **kwargs, allow_missing=True)[0]
+        expr[k] = _expand(v, **kwargs)
     return expr
 
 
@@ -122,7 +141,7 @@ def input_simjob_filename(config, **kwargs):
 
     fname = simjob_rel_basename() + f"-tier_{tier}" + config["filetypes"]["input"][tier]
     expr = str(Path(config["paths"]["macros"]) / f"{tier}" / fname)
-    return expand(expr, **kwargs, allow_missing=True)[0]
+    return _expand(expr, **kwargs)
 
 
 def output_simjob_filename(config, **kwargs):
@@ -137,7 +156,7 @@ def output_simjob_filename(config, **kwargs):
         simjob_rel_basename() + f"-tier_{tier}" + config["filetypes"]["output"][tier]
     )
     expr = str(Path(config["paths"][f"tier_{tier}"]) / fname)
-    return expand(expr, **kwargs, allow_missing=True)[0]
+    return _expand(expr, **kwargs)
 
 
 def output_simjob_regex(config, **kwargs):
@@ -149,7 +168,13 @@ def output_simjob_regex(config, **kwargs):
 
     fname = "*-tier_{tier}" + config["filetypes"]["output"][tier]
     expr = str(Path(config["paths"][f"tier_{tier}"]) / "{simid}" / fname)
-    return expand(expr, **kwargs, allow_missing=True)[0]
+    return _expand(expr, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _jobids(n_macros):
+    """Returns the (cached) tuple of the first `n_macros` job identifiers."""
+    return tuple(f"{i:04d}" for i in range(n_macros))
 
 
 def input_simid_filenames(config, n_macros, **kwargs):
@@ -157,24 +182,19 @@ def input_simid_filenames(config, n_macros, **kwargs):
     script that generates all macros for a `simid`.
     """
     pat = input_simjob_filename(config, **kwargs)
-    jobids = expand("{id:>04d}", id=list(range(n_macros)))
-    return expand(pat, jobid=jobids, **kwargs, allow_missing=True)
+    return expand(pat, jobid=_jobids(n_macros), **kwargs, allow_missing=True)
 
 
 def output_simid_filenames(config, n_macros, **kwargs):
     """Returns the full path to `n_macros` output files for a `simid`."""
     pat = output_simjob_filename(config, **kwargs)
-    jobids = expand("{id:>04d}", id=list(range(n_macros)))
-    return expand(pat, jobid=jobids, **kwargs, allow_missing=True)
+    return expand(pat, jobid=_jobids(n_macros), **kwargs, allow_missing=True)
 
 
 def smk_ver_filename_for_raw(config, wildcards):
     """Returns the vertices file needed for the 'raw' tier job, if needed. Used
     as lambda function in the `build_tier_raw` Snakemake rule."""
-    tdir = template_macro_dir(config, tier="raw")
-
-    with (tdir / "simconfig.json").open() as f:
-        sconfig = json.load(f)[wildcards.simid]
+    sconfig = utils.get_simconfig(config, "raw", wildcards.simid)
 
     if "vertices" in sconfig:
         return output_simjob_filename(config, tier="ver", simid=sconfig["vertices"])
@@ -186,7 +206,7 @@ def smk_ver_filename_for_raw(config, wildcards):
 
 
 def evtfile_rel_basename(**kwargs):
-    return expand("{simid}/{simid}_{runid}-tier_evt", **kwargs, allow_missing=True)[0]
+    return _expand("{simid}/{simid}_{runid}-tier_evt", **kwargs)
 
 
 def output_evt_filename(config, **kwargs):
@@ -194,26 +214,26 @@ def output_evt_filename(config, **kwargs):
         Path(config["paths"]["tier_evt"])
         / (evtfile_rel_basename() + config["filetypes"]["output"]["evt"])
     )
-    return expand(expr, **kwargs, allow_missing=True)[0]
+    return _expand(expr, **kwargs)
 
 
 def log_evtfile_path(config, **kwargs):
     pat = str(Path(config["paths"]["log"]) / "evt" / (evtfile_rel_basename() + ".log"))
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 def benchmark_evtfile_path(config, **kwargs):
     pat = str(
         Path(config["paths"]["benchmarks"]) / "evt" / (evtfile_rel_basename() + ".tsv")
     )
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 # pdf tier
 
 
 def pdffile_rel_basename(**kwargs):
-    return expand("{simid}/{simid}-tier_pdf", **kwargs, allow_missing=True)[0]
+    return _expand("{simid}/{simid}-tier_pdf", **kwargs)
 
 
 def pdf_config_path(config):
@@ -225,16 +245,16 @@ def output_pdf_filename(config, **kwargs):
         Path(config["paths"]["tier_pdf"])
         / (pdffile_rel_basename() + config["filetypes"]["output"]["pdf"])
     )
-    return expand(expr, **kwargs, allow_missing=True)[0]
+    return _expand(expr, **kwargs)
 
 
 def log_pdffile_path(config, **kwargs):
     pat = str(Path(config["paths"]["log"]) / "pdf" / (pdffile_rel_basename() + ".log"))
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
 
 
 def benchmark_pdffile_path(config, **kwargs):
     pat = str(
         Path(config["paths"]["benchmarks"]) / "pdf" / (pdffile_rel_basename() + ".tsv")
     )
-    return expand(pat, **kwargs, allow_missing=True)[0]
+    return _expand(pat, **kwargs)
@@ -16,6 +16,8 @@
 from __future__ import annotations
 
 import copy
+import functools
+import json
 import os
 import string
 from pathlib import Path
@@ -74,9 +76,10 @@ def subst_vars_in_snakemake_config(workflow, config):
 def get_some_list(field):
     """Get a list, whether it's in a file or directly specified."""
     if isinstance(field, str):
-        if Path(field).is_file():
-            with Path(field).open() as f:
-                slist = [line.rstrip() for line in f.readlines()]
+        path = Path(field)
+        if path.is_file():
+            with path.open() as f:
+                slist = [line.rstrip() for line in f if line.strip()]
         else:
             slist = [field]
     elif isinstance(field, list):
@@ -85,6 +88,39 @@ def get_some_list(field):
     return slist
 
 
+def tier_config_dir(cfgdir, experiment, tier):
+    """Returns the directory holding the configuration (simconfig, macro
+    templates) for `tier`."""
+    return Path(cfgdir) / "tier" / tier / experiment
+
+
+@functools.lru_cache(maxsize=None)
+def _read_simconfig_file(cfgdir, experiment, tier):
+    with (tier_config_dir(cfgdir, experiment, tier) / "simconfig.json").open() as f:
+        return json.load(f)
+
+
+def get_simconfig(config, tier, simid=None):
+    """Returns the ``simconfig.json`` content for `tier` (or just the block for
+    `simid`, if given).
+
+    The file is parsed only once, subsequent calls return the cached
+    dictionary. Do not modify it in place.
+    """
+    sconfig = _read_simconfig_file(
+        str(config["paths"]["config"]), config["experiment"], tier
+    )
+
+    if simid is None:
+        return sconfig
+
+    try:
+        return sconfig[simid]
+    except KeyError as e:
+        msg = f"simid '{simid}' not found in the simconfig.json of tier '{tier}'"
+        raise RuntimeError(msg) from e
+
+
 def set_last_rule_name(workflow, new_name):
     """Sets the name of the most recently created rule to be `new_name`.
     Useful when creating rules dynamically (i.e. unnamed).